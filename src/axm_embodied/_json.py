@@ -0,0 +1,52 @@
+"""JSON codec for the events.jsonl / candidates.jsonl hot paths.
+
+``orjson`` is an optional fast path (the ``fast`` extra). Parsing only
+takes it when it yields exactly what stdlib ``json`` would: lines it
+rejects (NaN/Infinity, which ``json.dumps`` writes; lone surrogates) or
+would parse lossily (integers beyond 64 bits, which orjson turns into
+floats) go through the stdlib instead. Encoding is for float-free
+candidate rows only, where the two always agree.
+"""
+from __future__ import annotations
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover — stdlib fallback
+    orjson = None
+
+# Any integer orjson cannot hold exactly has at least 19 digits; a run that
+# long anywhere in the line (a float's fraction, a string) merely costs a
+# stdlib parse, never a wrong value.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+# Built once: json.dumps constructs a fresh encoder for any non-default option.
+_encode_text = json.JSONEncoder(ensure_ascii=False).encode
+
+#: Compact stdlib JSON text, e.g. for a literal embedded in a candidate.
+#: Same output as ``json.dumps(obj, separators=(",", ":"))``.
+dumps_compact = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def loads(line: bytes):
+    """Parse one JSONL line; same value as ``json.loads(line)``."""
+    if orjson is not None and _LONG_DIGITS.search(line) is None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity are valid to stdlib json, not to RFC 8259
+    return json.loads(line)
+
+
+def dumps(obj) -> bytes:
+    """UTF-8 JSON for one candidate row.
+
+    Candidate rows hold only strings, ints, lists and dicts, where orjson
+    and ``json.dumps(obj, ensure_ascii=False)`` agree on the value. Do not
+    pass floats: orjson writes NaN/Infinity as ``null``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _encode_text(obj).encode("utf-8")
@@ -29,9 +29,9 @@ from __future__ import annotations
 import hashlib
 import json
 import math
-import struct
 import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -41,7 +41,7 @@ import numpy as np
 # ── Embodied-specific ─────────────────────────────────────────────────────
 from axm_embodied_core.protocol import (
     REC_HEADER_LEN,
-    REC_HEADER_FMT,
+    REC_HEADER,
     FILE_HEADER_LEN,
     LATENT_REC_LEN,
     LATENT_DIM,
@@ -90,7 +90,7 @@ def _read_residual_payload(res_path: Path, offset: int) -> np.ndarray:
         header = f.read(REC_HEADER_LEN)
         if len(header) < REC_HEADER_LEN:
             return np.array([], dtype=np.float32)
-        _, _, _, dlen = struct.unpack(REC_HEADER_FMT, header)
+        _, _, _, dlen = REC_HEADER.unpack(header)
         data = f.read(dlen)
     elements = len(data) // 4
     if elements == 0:
@@ -99,10 +99,16 @@ def _read_residual_payload(res_path: Path, offset: int) -> np.ndarray:
 
 
 def _capsule_hash(capsule_dir: Path) -> str:
-    """SHA-256 of events.jsonl — the byte-authoritative capsule identity."""
-    return hashlib.sha256(
-        (capsule_dir / "events.jsonl").read_bytes()
-    ).hexdigest()
+    """SHA-256 of events.jsonl — the byte-authoritative capsule identity.
+
+    Streamed in 1 MiB chunks so long sessions never materialize the whole
+    log in memory just to be hashed.
+    """
+    h = hashlib.sha256()
+    with open(capsule_dir / "events.jsonl", "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
 
 def latent_l_inf(latents: np.ndarray) -> float:
@@ -134,17 +140,22 @@ def compile_bounds(
     skipped_nonfinite = 0
 
     # ── 1. Ingest capsules and compute per-frame L-inf deltas ─────────────
-    for capsule_dir in sorted(Path(safe_dir).iterdir()):
-        if not capsule_dir.is_dir():
-            continue
+    capsule_dirs = [
+        d for d in sorted(Path(safe_dir).iterdir())
+        if d.is_dir()
+        and (d / "events.jsonl").exists()
+        and (d / "cam_latents.bin").exists()
+    ]
+    # Capsule hashes are independent and hashlib releases the GIL on large
+    # updates: hash every training log concurrently (map keeps the order).
+    with ThreadPoolExecutor() as ex:
+        cap_hashes = list(ex.map(_capsule_hash, capsule_dirs))
+
+    for capsule_dir, cap_hash in zip(capsule_dirs, cap_hashes):
         events_path = capsule_dir / "events.jsonl"
         lat_path = capsule_dir / "cam_latents.bin"
         res_path = capsule_dir / "cam_residuals.bin"
 
-        if not events_path.exists() or not lat_path.exists():
-            continue
-
-        cap_hash = _capsule_hash(capsule_dir)
         training_capsules.append((capsule_dir.name, cap_hash))
         frames_counted = 0
 
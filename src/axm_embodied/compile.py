@@ -51,7 +51,7 @@ import json
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import blake3
 import click
@@ -63,6 +63,13 @@ from axm_build.compiler_generic import CompilerConfig, compile_generic_shard
 from axm_embodied.keys import load_secret_key
 from axm_embodied.streams import build_streams_evidence
 
+# events.jsonl in, candidates.jsonl out (orjson when installed and exact)
+from axm_embodied._json import (
+    dumps as _dumps,
+    dumps_compact as _dumps_compact,
+    loads as _loads,
+)
+
 PROFILE_EMBODIED_V1 = "embodied@1"
 
 _NAMESPACE = "embodied/incident"
@@ -89,6 +96,53 @@ def derive_shard_id(shard_dir: Path) -> str:
 # Step 1: Extract embodied events -> candidates
 # ---------------------------------------------------------------------------
 
+# Event handlers: one per ontology event, registered in _EVENT_HANDLERS so
+# each line costs a single dict lookup. Every handler receives the deduping
+# ``add`` callback, the parsed event, the robot id, the verbatim line (the
+# evidence) and the optional envelope citation.
+
+def _on_wheel_slip(add: Callable[..., None], evt: dict, robot: str, text: str,
+                   envelope_ref: Optional[list]) -> None:
+    add(robot, "observed", "wheel_slip", "entity", 2, text)
+    if "surface" in evt:
+        add("wheel_slip", "on_surface", evt["surface"], "literal:string", 2, text)
+
+
+def _on_recovery_action(add: Callable[..., None], evt: dict, robot: str, text: str,
+                        envelope_ref: Optional[list]) -> None:
+    add("wheel_slip", "resolved_by", evt["action"], "entity", 1, text)
+    add(evt["action"], "applied_value", str(evt["value"]), "literal:string", 2, text)
+
+
+def _on_emergency_stop(add: Callable[..., None], evt: dict, robot: str, text: str,
+                       envelope_ref: Optional[list]) -> None:
+    add(robot, "triggered", "emergency_stop", "entity", 1, text)
+
+
+def _on_envelope_breach(add: Callable[..., None], evt: dict, robot: str, text: str,
+                        envelope_ref: Optional[list]) -> None:
+    # Actus Reus of the Shadow Runtime: physics left the signed
+    # envelope. These claims cite the envelope shard (references@1)
+    # so the incident is cryptographically linked to the exact law
+    # it broke.
+    add(robot, "breached_envelope", str(evt.get("action", "")),
+        "literal:string", 1, text, references=envelope_ref)
+    if isinstance(evt.get("l_inf"), (int, float)):
+        add(f"breach/frame-{evt['frame_id']}", "observed_l_inf",
+            str(evt["l_inf"]), "literal:decimal", 1, text)
+    if isinstance(evt.get("bound"), (int, float)):
+        add(f"breach/frame-{evt['frame_id']}", "envelope_bound",
+            str(evt["bound"]), "literal:decimal", 1, text)
+
+
+_EVENT_HANDLERS: dict[str, Callable[..., None]] = {
+    "wheel_slip": _on_wheel_slip,
+    "recovery_action": _on_recovery_action,
+    "emergency_stop": _on_emergency_stop,
+    "envelope_breach": _on_envelope_breach,
+}
+
+
 def _extract_candidates(
     events_path: Path,
     envelope_shard_id: Optional[str] = None,
@@ -104,7 +158,7 @@ def _extract_candidates(
         raw_bytes = f.read()
 
     candidates: list[dict] = []
-    seen: set[str] = set()
+    seen: set[tuple[str, str, str, str, str]] = set()
 
     envelope_ref = None
     if envelope_shard_id:
@@ -121,7 +175,7 @@ def _extract_candidates(
              references: Optional[list] = None) -> None:
         # Dedupe exact duplicate candidates; multiple DIFFERENT claims may
         # cite the same event line (the kernel dedupes rows by primary key).
-        key = f"{subj}\x00{pred}\x00{obj}\x00{obj_type}\x00{ev}"
+        key = (subj, pred, obj, obj_type, ev)
         if key in seen:
             return
         seen.add(key)
@@ -137,42 +191,19 @@ def _extract_candidates(
         if not line_bytes:
             continue
         text = line_bytes.decode("utf-8")
-        evt = json.loads(text)
+        evt = _loads(line_bytes)
         robot = evt.get("robot_id", "robot-001")
 
-        if evt.get("evt") == "wheel_slip":
-            _add(robot, "observed", "wheel_slip", "entity", 2, text)
-            if "surface" in evt:
-                _add("wheel_slip", "on_surface", evt["surface"], "literal:string", 2, text)
-
-        elif evt.get("evt") == "recovery_action":
-            _add("wheel_slip", "resolved_by", evt["action"], "entity", 1, text)
-            _add(evt["action"], "applied_value", str(evt["value"]),
-                 "literal:string", 2, text)
-
-        elif evt.get("evt") == "emergency_stop":
-            _add(robot, "triggered", "emergency_stop", "entity", 1, text)
-
-        elif evt.get("evt") == "envelope_breach":
-            # Actus Reus of the Shadow Runtime: physics left the signed
-            # envelope. These claims cite the envelope shard (references@1)
-            # so the incident is cryptographically linked to the exact law
-            # it broke.
-            _add(robot, "breached_envelope", str(evt.get("action", "")),
-                 "literal:string", 1, text, references=envelope_ref)
-            if isinstance(evt.get("l_inf"), (int, float)):
-                _add(f"breach/frame-{evt['frame_id']}", "observed_l_inf",
-                     str(evt["l_inf"]), "literal:decimal", 1, text)
-            if isinstance(evt.get("bound"), (int, float)):
-                _add(f"breach/frame-{evt['frame_id']}", "envelope_bound",
-                     str(evt["bound"]), "literal:decimal", 1, text)
+        kind = evt.get("evt")
+        handler = _EVENT_HANDLERS.get(kind) if isinstance(kind, str) else None
+        if handler is not None:
+            handler(_add, evt, robot, text, envelope_ref)
 
         # Mens Rea: action distribution on every frame
         if "selected_action" in evt and "action_distribution" in evt:
             _add(robot, "selected_action", evt["selected_action"], "entity", 1, text)
             for action, conf in evt["action_distribution"].items():
-                lit = json.dumps({"action": action, "confidence": conf},
-                                 separators=(",", ":"))
+                lit = _dumps_compact({"action": action, "confidence": conf})
                 _add(robot, "considered_action", lit, "literal:string", 2, text)
 
     return candidates
@@ -221,9 +252,8 @@ def compile_capsule(
 
     with tempfile.TemporaryDirectory(prefix="axm_compile_") as tmp:
         candidates_path = Path(tmp) / "candidates.jsonl"
-        with candidates_path.open("w", encoding="utf-8") as f:
-            for c in candidates:
-                f.write(json.dumps(c, ensure_ascii=False) + "\n")
+        with candidates_path.open("wb") as f:
+            f.write(b"".join(_dumps(c) + b"\n" for c in candidates))
 
         cfg = CompilerConfig(
             source_path=events_path,
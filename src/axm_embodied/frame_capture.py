@@ -44,7 +44,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from axm_embodied_core.protocol import REC_HEADER_FMT, REC_HEADER_LEN, VERSION
+from axm_embodied_core.protocol import REC_HEADER, REC_HEADER_LEN, VERSION
 
 # Frame-stream magics (see module docstring for placement rationale).
 MAGIC_FRAME_FILE = b"AXFF"  # frames.bin file header
@@ -68,12 +68,14 @@ PHYSICAL_TIER_LIMITS = (
 )
 
 
+# Resolved once at import: fdatasync skips the inode-metadata flush;
+# fsync is the non-POSIX fallback.
+_sync_fd = getattr(os, "fdatasync", os.fsync)
+
+
 def _fdatasync(fileobj) -> None:
     fileobj.flush()
-    if hasattr(os, "fdatasync"):
-        os.fdatasync(fileobj.fileno())
-    else:  # pragma: no cover — non-POSIX fallback
-        os.fsync(fileobj.fileno())
+    _sync_fd(fileobj.fileno())
 
 
 def chain_genesis(session_id: str) -> bytes:
@@ -217,7 +219,7 @@ class FrameCaptureRecorder:
         payload_hash = hashlib.sha256(payload).digest()
         self._chain = chain_next(self._chain, payload_hash, frame_id)
         offset = self._f_frames.tell()
-        header = struct.pack(REC_HEADER_FMT, MAGIC_FRAME_REC, VERSION, frame_id, len(payload))
+        header = REC_HEADER.pack(MAGIC_FRAME_REC, VERSION, frame_id, len(payload))
         self._f_frames.write(header + payload_hash + self._chain + payload)
         length = FRAME_REC_FIXED_LEN + len(payload)
         ref = KeptFrameRef(
@@ -335,7 +337,7 @@ class FrameJudge:
                     break  # clean EOF
                 if len(header) < REC_HEADER_LEN:
                     raise ValueError(f"FATAL: torn frame header at offset {offset}")
-                magic, ver, fid, dlen = struct.unpack(REC_HEADER_FMT, header)
+                magic, ver, fid, dlen = REC_HEADER.unpack(header)
                 if magic != MAGIC_FRAME_REC:
                     raise ValueError(f"FATAL: bad frame magic at offset {offset}")
                 if ver != VERSION:
@@ -43,6 +43,7 @@ import blake3
 
 from axm_build.compiler_generic import CompilerConfig, compile_generic_shard
 
+from axm_embodied._json import dumps as _dumps
 from axm_embodied.frame_capture import PHYSICAL_TIER, FrameJudge
 
 _NAMESPACE = "embodied/capture"
@@ -66,10 +67,10 @@ def _extract_candidates(events_path: Path) -> list[dict]:
     (a trigger was declared, a frame's bytes hash to H, the tier is
     physical_capture) — never what the pixels mean."""
     candidates: list[dict] = []
-    seen: set[str] = set()
+    seen: set[tuple[str, str, str, str, str]] = set()
 
     def _add(subj: str, pred: str, obj: str, obj_type: str, tier: int, ev: str) -> None:
-        key = f"{subj}\x00{pred}\x00{obj}\x00{obj_type}\x00{ev}"
+        key = (subj, pred, obj, obj_type, ev)
         if key in seen:
             return
         seen.add(key)
@@ -149,9 +150,8 @@ def compile_frame_capsule(
 
     with tempfile.TemporaryDirectory(prefix="axm_frame_compile_") as tmp:
         candidates_path = Path(tmp) / "candidates.jsonl"
-        with candidates_path.open("w", encoding="utf-8") as f:
-            for c in candidates:
-                f.write(json.dumps(c, ensure_ascii=False) + "\n")
+        with candidates_path.open("wb") as f:
+            f.write(b"".join(_dumps(c) + b"\n" for c in candidates))
 
         cfg = CompilerConfig(
             source_path=events_path,
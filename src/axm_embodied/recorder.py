@@ -20,7 +20,6 @@ from __future__ import annotations
 
 import json
 import os
-import struct
 import uuid
 from collections import deque
 from dataclasses import dataclass, field
@@ -29,30 +28,58 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from axm_embodied_core.protocol import (
+    FILE_HEADER_LEN,
     LATENT_DIM,
     LATENT_REC_LEN,
     MAGIC_LATENT_FILE,
     MAGIC_LATENT_REC,
     MAGIC_RESID_REC,
-    REC_HEADER_FMT,
+    REC_HEADER,
+    REC_HEADER_LEN,
     VERSION,
 )
 
 
+# Resolved once at import: fdatasync skips the inode-metadata flush;
+# fsync is the non-POSIX fallback.
+_sync_fd = getattr(os, "fdatasync", os.fsync)
+
+
+# Write buffer for bulk (non-fsync) sessions: the hot stream and the event
+# log reach the OS in a handful of large writes, not one per frame.
+_BULK_BUFFER = 1 << 20
+
+
+# events.jsonl line for a frame without an event, laid out exactly as
+# json.dumps renders the entry dict in CapsuleRecorder.record_frame.
+_LOG_LINE = (
+    '{{"frame_id": {}, "robot_id": {}, "selected_action": {}, '
+    '"action_distribution": {}, "stream_refs": {{"latents": '
+    '{{"file": "cam_latents.bin", "offset": {}, "length": %d}}}}}}' % LATENT_REC_LEN
+)
+
+
 def _fdatasync(fileobj) -> None:
     fileobj.flush()
-    if hasattr(os, "fdatasync"):
-        os.fdatasync(fileobj.fileno())
-    else:  # pragma: no cover — non-POSIX fallback
-        os.fsync(fileobj.fileno())
+    _sync_fd(fileobj.fileno())
 
 
 @dataclass(frozen=True)
 class RecorderConfig:
-    """Ring-buffer windows in frames; fsync policy for the hot stream."""
+    """Ring-buffer windows in frames; fsync policy for the hot stream.
+
+    ``fsync_every_frame`` is the field default and what the Shadow Runtime
+    flies with. Bulk generators (simulators, training corpora) may turn it
+    off: the hot stream is then group-committed every
+    ``group_commit_frames`` frames (0 = never mid-session), and always at
+    a trigger and at close — the semantic commit points. The hot stream
+    and the event log are then written through a large buffer, and the
+    log is flushed to the OS at every one of those commit points.
+    """
     pre_window_frames: int = 20    # history flushed when a trigger fires
     post_window_frames: int = 20   # future frames recorded after a trigger
     fsync_every_frame: bool = True
+    group_commit_frames: int = 32  # used only when fsync_every_frame is False
 
 
 @dataclass
@@ -78,8 +105,8 @@ class ResidualBuffer:
         self.recording_frames_left = 0
 
     def push(self, frame_id: int, data: bytes) -> str:
-        header = struct.pack(REC_HEADER_FMT, MAGIC_RESID_REC, VERSION, frame_id, len(data))
-        blob = header + data
+        header = REC_HEADER.pack(MAGIC_RESID_REC, VERSION, frame_id, len(data))
+        blob = header + data  # one write per record, whatever the payload size
         if self.recording_frames_left > 0:
             self.f.write(blob)
             self.recording_frames_left -= 1
@@ -92,8 +119,9 @@ class ResidualBuffer:
     def trigger(self) -> None:
         if self.recording_frames_left > 0:
             return  # already triggered
-        while self.buffer:
-            self.f.write(self.buffer.popleft())
+        if self.buffer:
+            self.f.write(b"".join(self.buffer))  # whole pre-window, one write
+            self.buffer.clear()
         _fdatasync(self.f)  # durability: commit history
         self.recording_frames_left = self.post_window
 
@@ -124,10 +152,18 @@ class CapsuleRecorder:
         self.path = Path(out_dir) / f"capsule-{self.session_id[:8]}"
         self.path.mkdir(parents=True, exist_ok=True)
 
-        self._f_lat = open(self.path / "cam_latents.bin", "wb", buffering=0)
+        self._f_lat = open(
+            self.path / "cam_latents.bin", "wb",
+            buffering=0 if config.fsync_every_frame else _BULK_BUFFER,
+        )
         self._f_res = open(self.path / "cam_residuals.bin", "wb")
-        self._f_log = open(self.path / "events.jsonl", "wb")
+        self._f_log = open(
+            self.path / "events.jsonl", "wb",
+            buffering=-1 if config.fsync_every_frame else _BULK_BUFFER,
+        )
         self._f_lat.write(MAGIC_LATENT_FILE)  # file-level magic (safety)
+        # One reusable AXLR record: header packed in place, payload spliced in.
+        self._lat_rec = bytearray(LATENT_REC_LEN)
 
         self._residuals = ResidualBuffer(
             self._f_res, config.pre_window_frames, config.post_window_frames
@@ -163,40 +199,63 @@ class CapsuleRecorder:
         frame_id = self._next_frame_id
         self._next_frame_id += 1
 
-        # Hot stream: strict offset captured BEFORE the write.
-        lat_offset = self._f_lat.tell()
-        header = struct.pack(REC_HEADER_FMT, MAGIC_LATENT_REC, VERSION, frame_id, len(latents))
-        self._f_lat.write(header + latents)
+        # Hot stream: strict offset math — fixed-size records after the
+        # file magic, so the offset never depends on buffering state.
+        lat_offset = FILE_HEADER_LEN + frame_id * LATENT_REC_LEN
+        rec = self._lat_rec
+        REC_HEADER.pack_into(rec, 0, MAGIC_LATENT_REC, VERSION, frame_id, LATENT_DIM)
+        rec[REC_HEADER_LEN:] = latents
+        self._f_lat.write(rec)
+        group_commit = False
         if self.config.fsync_every_frame:
             _fdatasync(self._f_lat)
+        elif self.config.group_commit_frames and (frame_id + 1) % self.config.group_commit_frames == 0:
+            _fdatasync(self._f_lat)  # group commit
+            group_commit = True
 
         # Cold stream: buffered until a trigger, then written through.
         if residual is not None:
             self._residuals.push(frame_id, residual)
 
         # Event log (Pattern 2: no residual pointers — disk is truth).
-        entry: Dict[str, Any] = {
-            "frame_id": frame_id,
-            "robot_id": self.robot_id,
-            "selected_action": selected_action,
-            "action_distribution": action_distribution,
-            "stream_refs": {
-                "latents": {
-                    "file": "cam_latents.bin",
-                    "offset": lat_offset,
-                    "length": LATENT_REC_LEN,
-                }
-            },
-        }
         if event:
+            entry: Dict[str, Any] = {
+                "frame_id": frame_id,
+                "robot_id": self.robot_id,
+                "selected_action": selected_action,
+                "action_distribution": action_distribution,
+                "stream_refs": {
+                    "latents": {
+                        "file": "cam_latents.bin",
+                        "offset": lat_offset,
+                        "length": LATENT_REC_LEN,
+                    }
+                },
+            }
             entry.update(event)
-        self._f_log.write(json.dumps(entry).encode("utf-8") + b"\n")
+            line = json.dumps(entry)
+        else:
+            # Fixed-shape frame: same bytes as json.dumps of the dict above,
+            # encoding only the caller-supplied values.
+            line = _LOG_LINE.format(
+                frame_id,
+                json.dumps(self.robot_id),
+                json.dumps(selected_action),
+                json.dumps(action_distribution),
+                lat_offset,
+            )
+        self._f_log.write(line.encode("utf-8") + b"\n")
+        if group_commit:
+            self._f_log.flush()  # the log reaches the OS with its frames
 
         return FrameRef(frame_id=frame_id, offset=lat_offset)
 
     def trigger(self) -> None:
         """Flash Freeze: flush the residual pre-window, arm the post-window."""
         self._triggered = True
+        if not self.config.fsync_every_frame:
+            _fdatasync(self._f_lat)  # commit the hot stream up to the event
+            self._f_log.flush()  # ...and hand the narrative to the OS with it
         self._residuals.trigger()
 
     @property
@@ -213,6 +272,8 @@ class CapsuleRecorder:
         if self._closed:
             return self.path
         self._closed = True
+        if not self.config.fsync_every_frame:
+            _fdatasync(self._f_lat)  # final group commit
         for f in (self._f_lat, self._f_res, self._f_log):
             f.close()
         (self.path / "meta.json").write_text(
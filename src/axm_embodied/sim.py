@@ -43,22 +43,24 @@ def vla_distribution(rng: random.Random, selected: str) -> Dict[str, float]:
     return dist
 
 
+def _uniform_frame(rng: random.Random, low: float, high: float) -> bytes:
+    """64 float32 drawn uniform in [low, high), as one vectorized scale.
+
+    Same draws and same arithmetic as ``rng.uniform(low, high)`` per value
+    (``low + (high - low) * random()``), so a seed reproduces its capsule.
+    """
+    draws = np.array([rng.random() for _ in range(_FLOATS_PER_FRAME)])
+    return (low + (high - low) * draws).astype(np.float32).tobytes()
+
+
 def nominal_latents(rng: random.Random, scale: float = 0.8) -> bytes:
     """A quiescent latent frame: 64 float32 in [0, scale)."""
-    vals = np.array(
-        [rng.uniform(0.0, scale) for _ in range(_FLOATS_PER_FRAME)],
-        dtype=np.float32,
-    )
-    return vals.tobytes()
+    return _uniform_frame(rng, 0.0, scale)
 
 
 def fault_latents(rng: random.Random, magnitude: float = 8.0) -> bytes:
     """A physics excursion: latent energy far outside any learned envelope."""
-    vals = np.array(
-        [rng.uniform(magnitude, magnitude * 2) for _ in range(_FLOATS_PER_FRAME)],
-        dtype=np.float32,
-    )
-    return vals.tobytes()
+    return _uniform_frame(rng, magnitude, magnitude * 2)
 
 
 @dataclass(frozen=True)
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import hashlib
-import json
-import struct
+import mmap
 from pathlib import Path
-from typing import BinaryIO
 from warnings import warn
 
+import numpy as np
+
 from axm_embodied_core.protocol import (
     MAGIC_LATENT_FILE,
     MAGIC_LATENT_REC,
     MAGIC_RESID_REC,
     VERSION,
-    REC_HEADER_FMT,
+    REC_HEADER,
     REC_HEADER_LEN,
     DEFAULT_MAX_RESIDUAL_SIZE,
     DEFAULT_MAX_RESYNC_BYTES,
@@ -22,6 +22,33 @@ from axm_embodied_core.protocol import (
     LATENT_DIM,
 )
 
+from axm_embodied._json import loads as _loads
+
+# One packed AXLR record (header + payload) as laid out in cam_latents.bin.
+LATENT_REC_DTYPE = np.dtype([
+    ("magic", "S4"),
+    ("ver", "u1"),
+    ("fid", "<u4"),
+    ("dlen", "<u4"),
+    ("data", "u1", (LATENT_DIM,)),
+])
+assert LATENT_REC_DTYPE.itemsize == LATENT_REC_LEN
+
+_sha256 = hashlib.sha256  # bound once: hashed per record on the hot path
+
+
+def _latent_header_status(magic: bytes, ver: int, fid: int, dlen: int, expected_fid: int) -> str | None:
+    """Header checks for one latent record, in verdict order; None if sound."""
+    if magic != MAGIC_LATENT_REC:
+        return "BAD_MAGIC"
+    if ver != VERSION:
+        return "BAD_VERSION"
+    if int(fid) != expected_fid:
+        return f"DRIFT (Found {int(fid)}, Exp {expected_fid})"
+    if int(dlen) != LATENT_DIM:
+        return f"BAD_DIM (Found {int(dlen)}, Exp {LATENT_DIM})"
+    return None
+
 
 class StrictJudge:
     """Pattern 2 Judge: disk is truth.
@@ -32,7 +59,6 @@ class StrictJudge:
 
     def __init__(self, capsule_path: Path):
         self.capsule_path = Path(capsule_path)
-        self.residual_index: dict[int, dict] = {}
         self.scan_stats = {
             "corrupt_headers": 0,
             "garbage_bytes": 0,
@@ -40,68 +66,46 @@ class StrictJudge:
             "records": 0,
         }
 
+        self.residual_index: dict[int, dict] = {}
         self._scan_residuals()
         self._open_latents()
 
-    def _resync_to_magic(self, f: BinaryIO, magic_bytes: bytes, start_pos: int) -> int:
+    def _resync_to_magic(self, mm: mmap.mmap, magic_bytes: bytes, start_pos: int) -> int:
         """Scan forward to find the next magic sequence.
 
         Returns the absolute file offset where magic starts, or -1 if not found within budget.
         """
-        chunk_size = 64 * 1024  # 64KB
-        scanned = 0
-
-        # We keep a small overlap so magic split across chunks can still be found.
-        overlap = len(magic_bytes) - 1
-        prev_tail = b""
-
-        f.seek(start_pos)
-        while scanned < DEFAULT_MAX_RESYNC_BYTES:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                return -1
-
-            hay = prev_tail + chunk
-            pos = hay.find(magic_bytes)
-            if pos != -1:
-                # f.tell() is at end of chunk; compute absolute offset of match.
-                end_off = f.tell()
-                start_of_hay = end_off - len(hay)
-                return start_of_hay + pos
-
-            # Prepare overlap for next iteration.
-            prev_tail = hay[-overlap:] if overlap > 0 else b""
-            scanned += len(chunk)
-
-        return -1
+        return mm.find(magic_bytes, start_pos, min(start_pos + DEFAULT_MAX_RESYNC_BYTES, len(mm)))
 
     def _scan_residuals(self) -> None:
+        """Index cam_residuals.bin by frame id: ``residual_index[fid]``
+        describes the LAST record on disk carrying that id.
+
+        The file is mapped read-only, so neither the scan nor the hashing
+        copies payloads through user-space read buffers. A missing or 0-byte
+        cold stream (safe run) indexes nothing.
+        """
         res_path = self.capsule_path / "cam_residuals.bin"
-        if not res_path.exists():
+        if not res_path.exists() or res_path.stat().st_size == 0:
             return
 
-        with open(res_path, "rb") as f:
-            while True:
-                start_off = f.tell()
-                header = f.read(REC_HEADER_LEN)
-
-                # Clean EOF
-                if len(header) == 0:
-                    break
-
+        with open(res_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start_off = 0
+            while start_off < size:
                 # Truncated header
-                if len(header) < REC_HEADER_LEN:
+                if size - start_off < REC_HEADER_LEN:
                     warn(f"Truncated residual header at offset {start_off}")
                     break
 
-                magic, ver, fid, dlen = struct.unpack(REC_HEADER_FMT, header)
+                magic, ver, fid, dlen = REC_HEADER.unpack_from(mm, start_off)
 
                 # 1. Magic check and resync
                 if magic != MAGIC_RESID_REC:
                     self.scan_stats["corrupt_headers"] += 1
                     warn(f"Corrupt residual magic {magic!r} at offset {start_off}. Resyncing.")
 
-                    next_off = self._resync_to_magic(f, MAGIC_RESID_REC, start_off + 1)
+                    next_off = self._resync_to_magic(mm, MAGIC_RESID_REC, start_off + 1)
                     if next_off == -1:
                         warn("Unable to resync residual stream. Stopping scan.")
                         break
@@ -113,7 +117,7 @@ class StrictJudge:
                     if garbage > DEFAULT_MAX_GARBAGE_BYTES:
                         warn(f"Large garbage span during resync: {garbage} bytes")
 
-                    f.seek(next_off)
+                    start_off = next_off
                     continue
 
                 # 2. Sanity checks
@@ -126,30 +130,75 @@ class StrictJudge:
                         f"FATAL: Residual payload size {int(dlen)} exceeds limit {DEFAULT_MAX_RESIDUAL_SIZE}"
                     )
 
-                # 3. Payload read
-                data = f.read(dlen)
-                if len(data) != dlen:
+                # 3. Payload
+                data_off = start_off + REC_HEADER_LEN
+                if size - data_off < dlen:
                     warn(f"Torn residual payload at frame {int(fid)}. Stopping scan.")
                     break
 
+                with memoryview(mm) as view:  # hash straight out of the mapping
+                    content_hash = _sha256(view[data_off:data_off + dlen]).hexdigest()
                 self.residual_index[int(fid)] = {
                     "offset": int(start_off),
                     "length": int(REC_HEADER_LEN + dlen),
-                    "content_hash": hashlib.sha256(data).hexdigest(),
+                    "content_hash": content_hash,
                     "status": "VERIFIED",
                 }
                 self.scan_stats["records"] += 1
+                start_off = data_off + dlen
 
     def _open_latents(self) -> None:
         lat_path = self.capsule_path / "cam_latents.bin"
-        self.f_lat = open(lat_path, "rb")
-        file_magic = self.f_lat.read(FILE_HEADER_LEN)
-        if file_magic != MAGIC_LATENT_FILE:
-            raise ValueError("FATAL: Invalid latent file header")
+        with open(lat_path, "rb") as f:
+            file_magic = f.read(FILE_HEADER_LEN)
+            if file_magic != MAGIC_LATENT_FILE:
+                raise ValueError("FATAL: Invalid latent file header")
+            self.lat_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.latent_status, self.latent_hash = self.verify_all_latents()
+
+    def verify_all_latents(self) -> tuple[list[str], list[str | None]]:
+        """Verify every whole record of the hot stream in one pass.
+
+        Record ``i`` is checked against frame id ``i`` (strict offset math).
+        Magic, version, frame id and dimension are compared as NumPy columns;
+        only failing records fall back to per-record verdict strings. Returns
+        ``(statuses, hashes)`` indexed by frame id.
+        """
+        n = (len(self.lat_mm) - FILE_HEADER_LEN) // LATENT_REC_LEN
+        if n <= 0:
+            return [], []
+        recs = np.frombuffer(self.lat_mm, dtype=LATENT_REC_DTYPE, count=n, offset=FILE_HEADER_LEN)
+        ok = (
+            (recs["magic"] == MAGIC_LATENT_REC)
+            & (recs["ver"] == VERSION)
+            & (recs["fid"] == np.arange(n, dtype=np.uint32))
+            & (recs["dlen"] == LATENT_DIM)
+        )
+
+        statuses = ["VERIFIED"] * n
+        hashes: list[str | None] = [None] * n
+        for i in np.flatnonzero(~ok).tolist():
+            r = recs[i]
+            statuses[i] = _latent_header_status(
+                bytes(r["magic"]), int(r["ver"]), int(r["fid"]), int(r["dlen"]), i
+            )
+        data = recs["data"]
+        for i in np.flatnonzero(ok).tolist():
+            hashes[i] = _sha256(data[i]).hexdigest()
+        return statuses, hashes
 
     def get_scan_stats(self) -> dict:
         return dict(self.scan_stats)
 
+    def close(self) -> None:
+        self.lat_mm.close()
+
+    def __enter__(self) -> "StrictJudge":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def verify_latent(self, claimed_offset: int, claimed_len: int, expected_fid: int) -> tuple[str, str | None]:
         # Strict offset math assertion
         math_offset = FILE_HEADER_LEN + (expected_fid * LATENT_REC_LEN)
@@ -159,28 +208,19 @@ class StrictJudge:
         if claimed_len != LATENT_REC_LEN:
             return f"LEN_MISMATCH (Claimed {claimed_len} != Const {LATENT_REC_LEN})", None
 
-        # Physical verification
-        self.f_lat.seek(claimed_offset)
-        header = self.f_lat.read(REC_HEADER_LEN)
-        if len(header) < REC_HEADER_LEN:
-            return "EOF", None
-
-        magic, ver, fid, dlen = struct.unpack(REC_HEADER_FMT, header)
-
-        if magic != MAGIC_LATENT_REC:
-            return "BAD_MAGIC", None
-        if ver != VERSION:
-            return "BAD_VERSION", None
-        if int(fid) != expected_fid:
-            return f"DRIFT (Found {int(fid)}, Exp {expected_fid})", None
-        if int(dlen) != LATENT_DIM:
-            return f"BAD_DIM (Found {int(dlen)}, Exp {LATENT_DIM})", None
+        # Physical verification (whole records were judged up front)
+        if 0 <= expected_fid < len(self.latent_status):
+            return self.latent_status[expected_fid], self.latent_hash[expected_fid]
 
-        data = self.f_lat.read(dlen)
-        if len(data) != dlen:
-            return "TORN_WRITE", None
+        # Past the last whole record: at best a torn tail.
+        if expected_fid < 0 or claimed_offset + REC_HEADER_LEN > len(self.lat_mm):
+            return "EOF", None
 
-        return "VERIFIED", hashlib.sha256(data).hexdigest()
+        magic, ver, fid, dlen = REC_HEADER.unpack_from(self.lat_mm, claimed_offset)
+        bad = _latent_header_status(magic, ver, fid, dlen, expected_fid)
+        if bad is not None:
+            return bad, None
+        return "TORN_WRITE", None
 
 
 def build_streams_evidence(capsule_path: Path) -> list[dict]:
@@ -193,17 +233,17 @@ def build_streams_evidence(capsule_path: Path) -> list[dict]:
     (spec/profiles/embodied@1.md section 7); the genesis compiler encodes
     them as canonical JSONL sorted by (stream, frame_id, offset).
     """
-    judge = StrictJudge(capsule_path)
     evidence: list[dict] = []
 
     events_path = Path(capsule_path) / "events.jsonl"
-    with open(events_path, "rb") as f:
+    with StrictJudge(capsule_path) as judge, open(events_path, "rb") as f:
         for line in f:
-            evt = json.loads(line)
+            evt = _loads(line)
             fid = int(evt["frame_id"])
 
             l_ref = evt["stream_refs"]["latents"]
-            stat, h = judge.verify_latent(int(l_ref["offset"]), int(l_ref["length"]), fid)
+            offset, length = int(l_ref["offset"]), int(l_ref["length"])
+            stat, h = judge.verify_latent(offset, length, fid)
             if stat != "VERIFIED":
                 raise ValueError(f"FATAL Frame {fid}: {stat}")
 
@@ -212,22 +252,22 @@ def build_streams_evidence(capsule_path: Path) -> list[dict]:
                     "frame_id": fid,
                     "stream": "latents",
                     "file": "cam_latents.bin",
-                    "offset": int(l_ref["offset"]),
-                    "length": int(l_ref["length"]),
+                    "offset": offset,
+                    "length": length,
                     "status": stat,
                     "content_hash": h,
                 }
             )
 
-            if fid in judge.residual_index:
-                rec = judge.residual_index[fid]
+            rec = judge.residual_index.get(fid)
+            if rec is not None:
                 evidence.append(
                     {
                         "frame_id": fid,
                         "stream": "residuals",
                         "file": "cam_residuals.bin",
-                        "offset": int(rec["offset"]),
-                        "length": int(rec["length"]),
+                        "offset": rec["offset"],
+                        "length": rec["length"],
                         "status": rec["status"],
                         "content_hash": rec["content_hash"],
                     }
@@ -18,24 +18,49 @@ from __future__ import annotations
 
 import base64
 import hashlib
+from functools import lru_cache
 
 # ── Delegate to genesis hub ───────────────────────────────────────────────
 from axm_verify.identity import (
-    recompute_entity_id as entity_id,
+    recompute_entity_id as _entity_id,
     recompute_claim_id as claim_id,
-    canonicalize,
+    canonicalize as _canonicalize,
 )
 
+# Pure and deterministic: namespaces, predicates and labels recur on every
+# event, so repeat lookups skip the NFKC/casefold pass (and hash) entirely.
+canonicalize = lru_cache(maxsize=8192)(_canonicalize)
+entity_id = lru_cache(maxsize=8192)(_entity_id)
+
 # ── Embodied-specific: byte-range identity ────────────────────────────────
 # These functions address physical telemetry byte positions.
 # No genesis equivalent exists. They remain local and frozen.
 
+def _encode(h: "hashlib._Hash", prefix: str) -> str:
+    """Truncate a finished SHA-256 state to 15 bytes and base32-encode it.
+
+    15 bytes is exactly 120 bits = 24 base32 characters, so the encoding
+    never carries ``=`` padding; lowercasing the ASCII bytes before decoding
+    yields the same string as the historical ``.lower().rstrip("=")``.
+    """
+    return prefix + base64.b32encode(h.digest()[:15]).lower().decode("ascii")
+
+
 def _hash(b: bytes, prefix: str) -> str:
     """Compute truncated SHA-256 hash with base32 encoding.
     Algorithm is frozen — changing this breaks all historical shard IDs.
     """
-    h = hashlib.sha256(b).digest()[:15]
-    return prefix + base64.b32encode(h).decode("ascii").lower().rstrip("=")
+    return _encode(hashlib.sha256(b), prefix)
+
+
+@lru_cache(maxsize=256)
+def _source_hasher(src_hash: str) -> "hashlib._Hash":
+    """SHA-256 state pre-fed with the constant span prefix (src_hash + NUL).
+
+    Every span of a source shares this prefix, so it is hashed once per
+    source. The cached state is shared: callers must ``.copy()`` it.
+    """
+    return hashlib.sha256(f"{src_hash}\x00".encode("utf-8"))
 
 
 def span_id(src_hash: str, start: int, end: int, text: str) -> str:
@@ -44,8 +69,9 @@ def span_id(src_hash: str, start: int, end: int, text: str) -> str:
     Frozen. Identical to original embodied implementation.
     Changing this invalidates all historical evidence/spans.jsonl joins.
     """
-    payload = f"{src_hash}\x00{start}\x00{end}\x00{text}"
-    return _hash(payload.encode("utf-8"), "s_")
+    h = _source_hasher(src_hash).copy()
+    h.update(f"{start}\x00{end}\x00{text}".encode("utf-8"))
+    return _encode(h, "s_")
 
 
 def prov_id(cid: str, sid: str) -> str:
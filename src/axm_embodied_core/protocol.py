@@ -3,6 +3,7 @@
 Single source of truth for on-disk magic values and record layouts.
 Keep this file stable. Recorder and Judge must remain synchronized.
 """
+import struct
 
 # File and record magics
 MAGIC_LATENT_FILE = b"AXLF"  # Latent file header
@@ -14,6 +15,7 @@ VERSION = 1
 # Header: [Magic(4) | Ver(1) | FrameID(4) | Length(4)] = 13 bytes
 REC_HEADER_FMT = "<4sBII"
 REC_HEADER_LEN = 13
+REC_HEADER = struct.Struct(REC_HEADER_FMT)  # compiled once; .size == REC_HEADER_LEN
 
 # Default safety bounds
 DEFAULT_MAX_RESIDUAL_SIZE = 10 * 1024 * 1024  # 10 MiB
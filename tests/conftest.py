@@ -9,7 +9,7 @@ from axm_build.sign import hybrid1_keygen
 
 from axm_embodied.bounds import compile_bounds
 from axm_embodied.gate import enroll_key
-from axm_embodied.recorder import CapsuleRecorder
+from axm_embodied.recorder import CapsuleRecorder, RecorderConfig
 from axm_embodied.sim import mission_frames
 
 FRAMES = 50
@@ -29,9 +29,9 @@ def robot_keys() -> tuple[bytes, bytes]:
 
 
 def record_mission(out_dir: Path, fault_at: int | None = None, seed: int = 7,
-                   frames: int = FRAMES) -> Path:
+                   frames: int = FRAMES, config: RecorderConfig = RecorderConfig()) -> Path:
     """Record one simulated mission straight through the recorder (no runtime)."""
-    with CapsuleRecorder(out_dir, robot_id="test-unit") as rec:
+    with CapsuleRecorder(out_dir, robot_id="test-unit", config=config) as rec:
         for fr in mission_frames(frames=frames, seed=seed, fault_at=fault_at,
                                  residual_bytes=RESIDUAL_BYTES):
             is_fault = fr.event is not None and fr.event.get("evt") == "wheel_slip"
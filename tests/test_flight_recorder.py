@@ -7,15 +7,18 @@ Corrupted binary -> StrictJudge kills the compile (disk is truth).
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
 from axm_verify.logic import verify_shard
 
-from axm_embodied.compile import compile_capsule
+from axm_embodied import recorder
+from axm_embodied.compile import _extract_candidates, compile_capsule
 from axm_embodied.recorder import RecorderConfig, CapsuleRecorder
-from axm_embodied_core.protocol import FILE_HEADER_LEN, LATENT_REC_LEN
+from axm_embodied.streams import build_streams_evidence
+from axm_embodied_core.protocol import FILE_HEADER_LEN, LATENT_DIM, LATENT_REC_LEN, REC_HEADER
 
 from conftest import FRAMES, record_mission
 
@@ -32,6 +35,14 @@ def test_safe_run_keeps_cold_stream_empty(tmp_path):
     # Hot stream: file magic + exactly one record per frame.
     expected = FILE_HEADER_LEN + FRAMES * LATENT_REC_LEN
     assert (cap / "cam_latents.bin").stat().st_size == expected
+    # Logged offsets land on the record carrying that frame id, and the
+    # fixed-shape log lines are exactly what json.dumps would write.
+    lat = (cap / "cam_latents.bin").read_bytes()
+    for line in (cap / "events.jsonl").read_text().splitlines():
+        entry = json.loads(line)
+        assert json.dumps(entry) == line
+        off = entry["stream_refs"]["latents"]["offset"]
+        assert REC_HEADER.unpack_from(lat, off)[2] == entry["frame_id"]
     meta = json.loads((cap / "meta.json").read_text())
     assert meta["frames"] == FRAMES
     assert meta["triggered"] is False
@@ -54,6 +65,91 @@ def test_recorder_rejects_short_latents(tmp_path):
     rec.close()
 
 
+def test_group_commit_writes_identical_streams(tmp_path):
+    """Relaxing the hot-stream fsync policy changes durability timing only,
+    never a byte on disk."""
+    caps = [
+        record_mission(tmp_path / name, fault_at=25, config=cfg)
+        for name, cfg in (("per_frame", RecorderConfig()),
+                          ("grouped", RecorderConfig(fsync_every_frame=False,
+                                                     group_commit_frames=8)))
+    ]
+    for fn in ("cam_latents.bin", "cam_residuals.bin", "events.jsonl"):
+        assert (caps[0] / fn).read_bytes() == (caps[1] / fn).read_bytes()
+
+
+@pytest.mark.parametrize("cfg, synced_at", [
+    # every frame, and nothing extra at trigger or close
+    (RecorderConfig(), list(range(1, FRAMES + 1))),
+    # every 8th frame, plus the trigger (before frame 25) and close
+    (RecorderConfig(fsync_every_frame=False, group_commit_frames=8),
+     [8, 16, 24, 25, 32, 40, 48, FRAMES]),
+    # group commit off: only the semantic commit points
+    (RecorderConfig(fsync_every_frame=False, group_commit_frames=0), [25, FRAMES]),
+])
+def test_hot_stream_sync_points(tmp_path, monkeypatch, cfg, synced_at):
+    """Each hot-stream sync lands exactly where the policy says, with every
+    preceding record already flushed to the file."""
+    synced: list[tuple[int, int]] = []
+    monkeypatch.setattr(
+        recorder, "_sync_fd",
+        lambda fd: synced.append((os.fstat(fd).st_ino, os.fstat(fd).st_size)),
+    )
+    cap = record_mission(tmp_path, fault_at=25, config=cfg)
+
+    lat_ino = (cap / "cam_latents.bin").stat().st_ino
+    frames = [(size - FILE_HEADER_LEN) // LATENT_REC_LEN
+              for ino, size in synced if ino == lat_ino]
+    assert frames == synced_at
+
+
+def test_bulk_log_reaches_the_os_at_commit_points(tmp_path):
+    """The bulk-mode log buffer never holds back frames that precede a
+    group commit or a trigger: a process killed right after Flash Freeze
+    still leaves a log that cites every committed frame."""
+    cfg = RecorderConfig(fsync_every_frame=False, group_commit_frames=8)
+    with CapsuleRecorder(tmp_path, robot_id="t", config=cfg) as rec:
+        log_lines = lambda: len((rec.path / "events.jsonl").read_bytes().splitlines())
+        for fid in range(30):
+            rec.record_frame(bytes(LATENT_DIM), "maintain_speed", {"maintain_speed": 1.0})
+            if fid == 19:
+                assert log_lines() == 16  # flushed with the frame-16 group commit
+        rec.trigger()
+        assert log_lines() == rec.frames_recorded
+
+
+def test_log_values_parse_exactly_as_stdlib_json(tmp_path):
+    """json.dumps writes NaN and arbitrary-precision ints; the compiler and
+    the judge read both back exactly as json.loads would, fast path or not."""
+    big = 123456789012345678901234567890
+    with CapsuleRecorder(tmp_path, robot_id="t") as rec:
+        rec.record_frame(bytes(LATENT_DIM), "maintain_speed",
+                         {"maintain_speed": float("nan")})
+        rec.record_frame(bytes(LATENT_DIM), "decelerate", {"decelerate": 1.0},
+                         event={"evt": "recovery_action", "action": "reduce_torque",
+                                "value": big})
+
+    rows = build_streams_evidence(rec.path)
+    assert [r["frame_id"] for r in rows] == [0, 1]
+
+    cands = _extract_candidates(rec.path / "events.jsonl")
+    objects = {(c["predicate"], c["object"]) for c in cands}
+    assert ("applied_value", str(big)) in objects
+    assert ("considered_action", '{"action":"maintain_speed","confidence":NaN}') in objects
+
+
+def test_non_string_event_kinds_are_skipped(tmp_path):
+    """Caller-supplied events are arbitrary JSON; an "evt" that is not a
+    string names no ontology event and is simply not a claim."""
+    with CapsuleRecorder(tmp_path, robot_id="t") as rec:
+        for kind in (["wheel_slip"], {"wheel_slip": 1}, 7):
+            rec.record_frame(bytes(LATENT_DIM), "maintain_speed", {"maintain_speed": 1.0},
+                             event={"evt": kind})
+
+    cands = _extract_candidates(rec.path / "events.jsonl")
+    assert {c["predicate"] for c in cands} == {"selected_action", "considered_action"}
+
+
 def test_crash_capsule_compiles_to_verified_shard(tmp_path, robot_keys):
     pub, key = robot_keys
     cap = record_mission(tmp_path, fault_at=25)
@@ -7,6 +7,10 @@ safe run leaves a 0-byte cold stream; a crash run injects a wheel-slip
 physics excursion at frame 50 and triggers Flash Freeze exactly as the
 Shadow Runtime would.
 
+Simulated capsules are demo data, so the hot stream is group-committed
+(trigger and close are the durability points) rather than fsync'd on
+every frame.
+
 For the full enforcement loop (Law Gate, signed envelope, ESTOP, incident
 shard), use `axm-runtime fly` instead.
 """
@@ -14,14 +18,17 @@ from __future__ import annotations
 
 import argparse
 
-from axm_embodied.recorder import CapsuleRecorder
+from axm_embodied.recorder import CapsuleRecorder, RecorderConfig
 from axm_embodied.sim import mission_frames
 
+# Frozen, so one instance serves every session this process generates.
+SIM_CONFIG = RecorderConfig(fsync_every_frame=False)
+
 
 def generate_session(out_dir: str, crash: bool = False, frames: int = 100,
                      seed: int | None = None, robot_id: str = "sim-final") -> None:
     fault_at = frames // 2 if crash else None
-    with CapsuleRecorder(out_dir, robot_id=robot_id) as rec:
+    with CapsuleRecorder(out_dir, robot_id=robot_id, config=SIM_CONFIG) as rec:
         print(f"Generating: {rec.session_id} (Crash={crash})")
         for fr in mission_frames(frames=frames, seed=seed, fault_at=fault_at):
             is_fault = fr.event is not None and fr.event.get("evt") == "wheel_slip"